@@ -6,7 +6,7 @@ Cada nó guarda payload = {'name':..., 'points':..., ...} e a chave usada para o
 
 Fornece:
 - AVLNode: nó com altura armazenada
-- AVL: insert, root, height, inorder (retorna valores em ordem crescente da chave)
+- AVL: insert, find, root, height, inorder (retorna valores em ordem crescente da chave)
 - build_avl_from_stats(stats_list): constroi AVL a partir da lista de stats (qualquer ordem)
 """
 
@@ -109,6 +109,18 @@ class AVL:
         key = (value.get("points", 0), value.get("name", ""))
         self.root = self._insert_node(self.root, key, value)
 
+    def find(self, key: Tuple[int, str]) -> Optional[Dict[str, Any]]:
+        """Busca iterativa pela chave (points, name). Complexidade: O(log T)."""
+        cur = self.root
+        while cur:
+            if key == cur.key:
+                return cur.value
+            elif key < cur.key:
+                cur = cur.left
+            else:
+                cur = cur.right
+        return None
+
     def root_value(self):
         return self.root.value if self.root else None
 
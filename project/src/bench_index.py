@@ -0,0 +1,100 @@
+# src/bench_index.py
+"""
+Benchmark dos índices: BST x AVL x B+-tree (src.btree) indexando cada partida pela
+chave única de src.btree.match_keys (data, mandante, visitante, ocorrência).
+
+Mede, para cada estrutura:
+- construção (inserções em ordem aleatória; a B+-tree também via bulk_load ordenado)
+- buscas pontuais (find de todas as chaves, em ordem aleatória)
+- varredura completa (inorder) e, na B+-tree, varredura por intervalo (um ano)
+
+Uso (a partir de project/):  python -m src.bench_index [repeticoes]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime
+
+from src.avl_points import AVL
+from src.bst import BST
+from src.btree import BPlusTree, match_keys
+from src.main import find_csv, read_matches
+
+def _timeit(fn, repeat: int = 3):
+    """Retorna (melhor tempo em segundos, resultado da última execução)."""
+    best = float("inf")
+    res = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        res = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, res
+
+def _report(label: str, seconds: float, ops: int):
+    rate = ops / seconds if seconds > 0 else float("inf")
+    print(f"  {label:<28} {seconds * 1000:9.1f} ms   {rate:14,.0f} ops/s")
+
+def run(repeat: int = 3, seed: int = 42):
+    matches, _, _ = read_matches(find_csv())
+    # uma chave por partida; como a AVL ordena por (points, name), as três estruturas usam
+    # (ordinal da data, "mandante\0visitante\0ocorrência"); a ocorrência tem 4 dígitos com
+    # zeros à esquerda para que a ordem da string siga a numérica ("0010" > "0002")
+    payloads = [
+        {"points": d.toordinal(), "name": f"{h}\0{a}\0{occ:04d}", "match": m}
+        for (d, h, a, occ), m in zip(match_keys(matches), matches)
+    ]
+    rng = random.Random(seed)
+    rng.shuffle(payloads)
+    shuffled = [(p["points"], p["name"]) for p in payloads]
+    payloads_sorted = sorted(payloads, key=lambda p: (p["points"], p["name"]))
+    n = len(payloads)
+    assert n == len(matches)
+    print(f"Partidas indexadas: {n}")
+
+    def build_bst():
+        t = BST(key_func=lambda p: (p["points"], p["name"]))
+        for p in payloads:
+            t.insert(p)
+        return t
+
+    def build_avl():
+        t = AVL()
+        for p in payloads:
+            t.insert(p)
+        return t
+
+    def build_btree():
+        t = BPlusTree(key_func=lambda p: (p["points"], p["name"]))
+        for p in payloads:
+            t.insert(p)
+        return t
+
+    def bulk_btree():
+        t = BPlusTree(key_func=lambda p: (p["points"], p["name"]))
+        t.bulk_load(payloads_sorted)
+        return t
+
+    year_lo = (datetime(2000, 1, 1).toordinal(), "")
+    year_hi = (datetime(2000, 12, 31).toordinal(), "\uffff")
+
+    for label, builder in (("BST", build_bst), ("AVL", build_avl), ("B+-tree", build_btree)):
+        print(f"\n{label}:")
+        secs, tree = _timeit(builder, repeat)
+        _report("construção (insert)", secs, n)
+        secs, found = _timeit(lambda: sum(1 for k in shuffled if tree.find(k) is not None), repeat)
+        assert found == n
+        _report("find (todas as chaves)", secs, n)
+        secs, _ = _timeit(tree.inorder, repeat)
+        _report("varredura inorder", secs, n)
+        if isinstance(tree, BPlusTree):
+            secs, tree = _timeit(bulk_btree, repeat)
+            _report("construção (bulk_load)", secs, n)
+            secs, rows = _timeit(lambda: tree.range(year_lo, year_hi), repeat)
+            _report(f"range ano 2000 ({len(rows)} part.)", secs, len(rows))
+            print(f"  altura: {tree.height()} (order={tree.order})")
+        elif isinstance(tree, AVL):
+            print(f"  altura: {tree.height()}")
+
+if __name__ == "__main__":
+    run(repeat=int(sys.argv[1]) if len(sys.argv) > 1 else 3)
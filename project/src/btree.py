@@ -0,0 +1,289 @@
+# src/btree.py
+"""
+Árvore B+ (B+-tree) com alto fan-out, alternativa às árvores binárias baseadas em ponteiros.
+
+Cada nó guarda um vetor ordenado de chaves (listas Python contíguas), então uma busca
+visita poucos nós (altura ~ log_order(N)) e usa bisect dentro de cada nó.
+Os valores ficam apenas nas folhas, que são encadeadas (next) para varreduras por intervalo.
+
+Fornece:
+- BPlusTree: insert, find, inorder, inorder_with_keys (mesma interface da BST),
+             range (varredura por intervalo nas folhas encadeadas), bulk_load (carga ordenada)
+- build_btree_by_name(matches): índice de seleções por nome (payload com gols)
+- match_keys(matches): chave única por partida (data, mandante, visitante, ocorrência)
+- build_btree_by_match(matches): índice de partidas individuais por match_keys
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.bst import _accumulate_goals
+
+class BPlusLeaf:
+    __slots__ = ("keys", "values", "next")
+
+    def __init__(self):
+        self.keys: List[Any] = []
+        self.values: List[Any] = []
+        self.next: Optional['BPlusLeaf'] = None
+
+    def __repr__(self):
+        return f"BPlusLeaf(n={len(self.keys)}, first={self.keys[:1]})"
+
+class BPlusInternal:
+    __slots__ = ("keys", "children")
+
+    def __init__(self):
+        # children[i] contém chaves < keys[i]; children[i+1] contém chaves >= keys[i]
+        self.keys: List[Any] = []
+        self.children: List[Any] = []
+
+    def __repr__(self):
+        return f"BPlusInternal(n={len(self.keys)}, first={self.keys[:1]})"
+
+class BPlusTree:
+    def __init__(self, key_func: Callable[[Any], Any] = lambda x: x, order: int = 64):
+        """
+        key_func: função que extrai a chave de comparação a partir de 'value' (como na BST).
+        order: número máximo de chaves por nó (fan-out). Deve ser >= 3.
+        """
+        if order < 3:
+            raise ValueError("order deve ser >= 3")
+        self.key_func = key_func
+        self.order = order
+        self.root: Any = BPlusLeaf()
+        self.size = 0
+
+    # ---------- busca ----------
+    def _find_leaf(self, key: Any) -> BPlusLeaf:
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def find(self, key: Any) -> Optional[Any]:
+        """Retorna o valor associado à chave ou None. Complexidade: O(log N)."""
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        return None
+
+    # ---------- inserção ----------
+    def insert(self, value: Any):
+        """Insere value; chave usada é key_func(value). Se chave já existe, substitui o payload."""
+        key = self.key_func(value)
+        split = self._insert(self.root, key, value)
+        if split is not None:
+            sep, right = split
+            new_root = BPlusInternal()
+            new_root.keys = [sep]
+            new_root.children = [self.root, right]
+            self.root = new_root
+
+    def _insert(self, node: Any, key: Any, value: Any) -> Optional[Tuple[Any, Any]]:
+        """Insere recursivamente; retorna (chave separadora, novo nó à direita) se o nó dividiu."""
+        if isinstance(node, BPlusLeaf):
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                node.values[i] = value
+                return None
+            node.keys.insert(i, key)
+            node.values.insert(i, value)
+            self.size += 1
+            if len(node.keys) <= self.order:
+                return None
+            mid = len(node.keys) // 2
+            right = BPlusLeaf()
+            right.keys = node.keys[mid:]
+            right.values = node.values[mid:]
+            del node.keys[mid:]
+            del node.values[mid:]
+            right.next = node.next
+            node.next = right
+            return right.keys[0], right
+
+        i = bisect_right(node.keys, key)
+        split = self._insert(node.children[i], key, value)
+        if split is None:
+            return None
+        sep, child = split
+        node.keys.insert(i, sep)
+        node.children.insert(i + 1, child)
+        if len(node.keys) <= self.order:
+            return None
+        mid = len(node.keys) // 2
+        right = BPlusInternal()
+        up = node.keys[mid]
+        right.keys = node.keys[mid + 1:]
+        right.children = node.children[mid + 1:]
+        del node.keys[mid:]
+        del node.children[mid + 1:]
+        return up, right
+
+    # ---------- carga em lote ----------
+    def bulk_load(self, values: List[Any], fill: float = 1.0):
+        """
+        Constrói a árvore a partir de values já ordenados por key_func (substitui o conteúdo atual).
+        Chaves repetidas: o último payload prevalece (como em insert).
+        fill: fração de ocupação das folhas (ex.: 0.7 deixa espaço para inserções futuras).
+        Complexidade: O(N), contra O(N log N) de N inserções.
+        """
+        per_leaf = max(2, min(self.order, int(self.order * fill)))
+        keys: List[Any] = []
+        vals: List[Any] = []
+        for v in values:
+            k = self.key_func(v)
+            if keys and k <= keys[-1]:
+                if k == keys[-1]:
+                    vals[-1] = v
+                    continue
+                raise ValueError("bulk_load exige valores ordenados pela chave")
+            keys.append(k)
+            vals.append(v)
+
+        self.size = len(keys)
+        if not keys:
+            self.root = BPlusLeaf()
+            return
+
+        # 1) folhas encadeadas
+        level: List[Any] = []
+        seps: List[Any] = []
+        prev: Optional[BPlusLeaf] = None
+        for start in range(0, len(keys), per_leaf):
+            leaf = BPlusLeaf()
+            leaf.keys = keys[start:start + per_leaf]
+            leaf.values = vals[start:start + per_leaf]
+            if prev is not None:
+                prev.next = leaf
+            prev = leaf
+            level.append(leaf)
+            seps.append(leaf.keys[0])
+
+        # 2) níveis internos até sobrar um único nó (até order+1 filhos por nó)
+        fanout = self.order + 1
+        while len(level) > 1:
+            next_level: List[Any] = []
+            next_seps: List[Any] = []
+            for start in range(0, len(level), fanout):
+                node = BPlusInternal()
+                node.children = level[start:start + fanout]
+                node.keys = seps[start + 1:start + len(node.children)]
+                next_level.append(node)
+                next_seps.append(seps[start])
+            # evita último nó interno com um único filho (sem chaves): empresta um filho do anterior
+            if len(next_level) > 1 and not next_level[-1].keys:
+                last, prev_node = next_level[-1], next_level[-2]
+                moved = prev_node.children.pop()
+                moved_sep = prev_node.keys.pop()
+                last.keys = [next_seps[-1]]
+                last.children.insert(0, moved)
+                next_seps[-1] = moved_sep
+            level, seps = next_level, next_seps
+        self.root = level[0]
+
+    # ---------- varreduras ----------
+    def _first_leaf(self) -> BPlusLeaf:
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[0]
+        return node
+
+    def iter_items(self, lo: Any = None, hi: Any = None) -> Iterator[Tuple[Any, Any]]:
+        """
+        Percorre (key, value) em ordem crescente com lo <= key <= hi
+        (None = sem limite), seguindo o encadeamento das folhas.
+        """
+        if lo is None:
+            leaf = self._first_leaf()
+            i = 0
+        else:
+            leaf = self._find_leaf(lo)
+            i = bisect_left(leaf.keys, lo)
+        while leaf is not None:
+            keys = leaf.keys
+            if hi is not None and keys and keys[-1] > hi:
+                j = bisect_right(keys, hi, i)
+                yield from zip(keys[i:j], leaf.values[i:j])
+                return
+            yield from zip(keys[i:], leaf.values[i:])
+            leaf = leaf.next
+            i = 0
+
+    def range(self, lo: Any = None, hi: Any = None) -> List[Any]:
+        """Retorna valores com lo <= chave <= hi. Complexidade: O(log N + R), R = resultados."""
+        return [v for _, v in self.iter_items(lo, hi)]
+
+    def inorder(self) -> List[Any]:
+        """Retorna lista de valores em ordem crescente da chave."""
+        res: List[Any] = []
+        leaf = self._first_leaf()
+        while leaf is not None:
+            res.extend(leaf.values)
+            leaf = leaf.next
+        return res
+
+    def inorder_with_keys(self) -> List[Tuple[Any, Any]]:
+        """Retorna lista de (key, value) em ordem."""
+        return list(self.iter_items())
+
+    def height(self) -> int:
+        h = 1
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[0]
+            h += 1
+        return h
+
+# ---------- utilitários específicos para o dataset ----------
+
+def build_btree_by_name(matches, order: int = 64) -> BPlusTree:
+    """
+    Índice de seleções por nome (payload {'name', 'goals'}), via bulk_load.
+    Complexidade: O(N) acumulação + O(T log T) ordenação + O(T) carga.
+    """
+    totals = _accumulate_goals(matches)
+    payloads = [{"name": name, "goals": goals} for name, goals in sorted(totals.items())]
+    tree = BPlusTree(key_func=lambda v: v["name"], order=order)
+    tree.bulk_load(payloads)
+    return tree
+
+def match_keys(matches) -> List[Tuple[datetime, str, str, int]]:
+    """
+    Retorna uma chave única por partida: (data, mandante, visitante, ocorrência).
+    (data, mandante) e até (data, mandante, visitante) se repetem no dataset
+    (ex.: Malaysia com 3 jogos em casa em 1973-08-03); 'ocorrência' numera as
+    repetições na ordem do CSV (0 para a primeira).
+    """
+    seen: Dict[Tuple[datetime, str, str], int] = {}
+    keys = []
+    for m in matches:
+        base = (m.date, m.home_team.name, m.away_team.name)
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        keys.append(base + (n,))
+    return keys
+
+def build_btree_by_match(matches, order: int = 64) -> BPlusTree:
+    """
+    Índice de partidas individuais: payload {'key': match_keys(...)[i], 'match': Match}.
+    Todas as partidas entram na árvore (tree.size == len(matches)).
+    Permite, por exemplo, varrer as partidas de um dia/ano com range((d0,), (d1, '\\uffff')).
+    """
+    payloads = [{"key": k, "match": m} for k, m in zip(match_keys(matches), matches)]
+    payloads.sort(key=lambda p: p["key"])
+    tree = BPlusTree(key_func=lambda p: p["key"], order=order)
+    tree.bulk_load(payloads)
+    return tree
+
+# ---------- exemplo rápido ----------
+if __name__ == "__main__":
+    t = BPlusTree(order=4)
+    for x in [10, 3, 7, 1, 15, 12, 8, 4, 20, 6]:
+        t.insert(x)
+    print("height:", t.height(), "size:", t.size)
+    print("inorder:", t.inorder())
+    print("range(4, 12):", t.range(4, 12))
+    print("find(7):", t.find(7), "find(9):", t.find(9))
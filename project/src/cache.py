@@ -0,0 +1,223 @@
+# src/cache.py
+"""
+Cache de resultados (memoização) para as consultas de ranking e busca.
+
+Fornece:
+- LRUCache: cache limitado por número de entradas e/ou bytes, com despejo LRU
+            (menos recentemente usado) e contadores de hits/misses
+- QueryCache: envolve top_k_by_points, bottom_k_by_points, top_k_by_inorder_goals,
+              binary_search e linear_search sobre datasets registrados por nome
+              (set_dataset). A chave é (dataset, versão, consulta, parâmetros), então
+              resultados nunca são reaproveitados para outro conjunto de dados. set_dataset
+              compara a impressão digital (hash) do conteúdo: se mudou — inclusive por
+              alteração in-place da mesma lista — invalida apenas as entradas daquele
+              dataset; as dos demais continuam válidas.
+"""
+
+import hashlib
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from src.bst import top_k_by_inorder_goals
+from src.search import binary_search, linear_search
+from src.sorting import bottom_k_by_points, top_k_by_points
+
+_MISSING = object()
+
+def _deep_sizeof(value: Any) -> int:
+    """
+    Estimativa (aproximada) do tamanho em bytes de um resultado:
+    percorre listas/tuplas/dicts de um nível de profundidade (payloads das seleções).
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        for v in value:
+            size += sys.getsizeof(v)
+            if isinstance(v, dict):
+                size += sum(sys.getsizeof(k) + sys.getsizeof(x) for k, x in v.items())
+    elif isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(x) for k, x in value.items())
+    return size
+
+def _fingerprint(data: Any) -> str:
+    """
+    Hash (sha1) do conteúdo de um dataset. Árvores (BST/AVL/B+-tree) são resumidas
+    pelo percurso em ordem, já que não têm repr de conteúdo.
+    Complexidade: O(n) no tamanho do dataset.
+    """
+    if hasattr(data, "inorder_with_keys"):
+        content = data.inorder_with_keys()
+    elif hasattr(data, "inorder"):
+        content = data.inorder()
+    else:
+        content = data
+    return hashlib.sha1(repr(content).encode("utf-8")).hexdigest()
+
+class LRUCache:
+    def __init__(self, max_entries: Optional[int] = 256, max_bytes: Optional[int] = None,
+                 size_fn: Callable[[Any], int] = _deep_sizeof):
+        """
+        max_entries: número máximo de entradas (None = sem limite por contagem).
+        max_bytes: total máximo estimado em bytes (None = sem limite por tamanho).
+        size_fn: função que estima o tamanho de um valor em bytes.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_fn = size_fn
+        # OrderedDict mantém a ordem de uso: início = menos recente, fim = mais recente
+        self._data: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Retorna o valor e marca a entrada como mais recente. Complexidade: O(1)."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any):
+        """Insere/substitui a entrada e despeja as menos recentes se exceder os limites."""
+        nbytes = self.size_fn(value) if self.max_bytes is not None else 0
+        if key in self._data:
+            self.bytes -= self._data.pop(key)[1]
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            # valor sozinho já excede o limite: não armazenamos
+            return
+        self._data[key] = (value, nbytes)
+        self.bytes += nbytes
+        self._evict()
+
+    def _evict(self):
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            _, (_, nbytes) = self._data.popitem(last=False)
+            self.bytes -= nbytes
+            self.evictions += 1
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove as entradas cuja chave satisfaz predicate. Retorna quantas foram removidas."""
+        stale = [k for k in self._data if predicate(k)]
+        for k in stale:
+            self.bytes -= self._data.pop(k)[1]
+        return len(stale)
+
+    def clear(self):
+        self._data.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._data),
+            "bytes": self.bytes,
+        }
+
+class QueryCache:
+    def __init__(self, max_entries: Optional[int] = 256, max_bytes: Optional[int] = None):
+        self._datasets: Dict[str, Any] = {}
+        self._versions: Dict[str, int] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._lru = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+
+    # ---------- datasets ----------
+    def set_dataset(self, name: str, data: Any) -> int:
+        """
+        Registra (ou atualiza) o dataset 'name' sobre o qual as consultas são feitas.
+        Compara a impressão digital do conteúdo com a registrada:
+        - igual (mesmo conteúdo, mesmo que seja outro objeto): as entradas continuam válidas;
+        - diferente (novo conteúdo ou a mesma lista alterada in-place): incrementa a versão
+          do dataset e remove só as entradas dele.
+        Retorna o número de entradas invalidadas.
+        """
+        fp = _fingerprint(data)
+        self._datasets[name] = data
+        if name not in self._versions:
+            self._versions[name] = 0
+            self._fingerprints[name] = fp
+            return 0
+        if self._fingerprints[name] == fp:
+            return 0
+        self._fingerprints[name] = fp
+        return self.invalidate(name)
+
+    def invalidate(self, name: str) -> int:
+        """Incrementa a versão de 'name' e remove suas entradas. Retorna quantas foram removidas."""
+        self._versions[name] = self._versions.get(name, 0) + 1
+        return self._lru.invalidate(lambda key: key[0] == name)
+
+    def dataset(self, name: str) -> Any:
+        if name not in self._datasets:
+            raise KeyError(f"dataset não registrado no cache: {name!r}")
+        return self._datasets[name]
+
+    def version(self, name: str) -> int:
+        return self._versions.get(name, 0)
+
+    def stats(self) -> Dict[str, int]:
+        s = self._lru.stats()
+        s["datasets"] = len(self._datasets)
+        return s
+
+    def _memo(self, name: str, query: str, params: Tuple, compute: Callable[[Any], Any]) -> Any:
+        data = self.dataset(name)
+        key = (name, self._versions[name], query, params)
+        result = self._lru.get(key, _MISSING)
+        if result is _MISSING:
+            result = compute(data)
+            self._lru.put(key, result)
+        return result
+
+    # ---------- consultas de ranking ----------
+    def top_k_by_points(self, name: str, k: int = 10, use_merge: bool = True) -> List[Dict]:
+        """top_k_by_points sobre o dataset 'name' (lista de stats)."""
+        res = self._memo(name, "top_k_by_points", (k, use_merge),
+                         lambda stats: top_k_by_points(stats, k, use_merge=use_merge))
+        return list(res)  # cópia rasa: quem chama pode alterar a lista sem afetar o cache
+
+    def bottom_k_by_points(self, name: str, k: int = 10, use_merge: bool = True) -> List[Dict]:
+        res = self._memo(name, "bottom_k_by_points", (k, use_merge),
+                         lambda stats: bottom_k_by_points(stats, k, use_merge=use_merge))
+        return list(res)
+
+    def top_k_by_inorder_goals(self, name: str, k: int = 10, reverse: bool = True) -> List[Dict]:
+        """top_k_by_inorder_goals sobre o dataset 'name' (BST por gols)."""
+        res = self._memo(name, "top_k_by_inorder_goals", (k, reverse),
+                         lambda bst: top_k_by_inorder_goals(bst, k, reverse=reverse))
+        return list(res)
+
+    # ---------- buscas ----------
+    def binary_search(self, name: str, field: str, target: Any) -> Optional[int]:
+        """
+        Busca binária por item[field] == target; o dataset 'name' deve estar ordenado
+        por field em ordem ascendente. A chave de busca é derivada de field, então
+        a chave do cache descreve exatamente a consulta feita.
+        """
+        return self._memo(name, "binary_search", (field, target),
+                          lambda arr: binary_search(arr, key_fn=lambda s: s[field], target=target))
+
+    def linear_search(self, name: str, field: str, value: Any, ignore_case: bool = False) -> Optional[int]:
+        """Índice do primeiro item com item[field] == value (opcionalmente sem diferenciar maiúsculas)."""
+        if ignore_case:
+            value = value.lower()
+            predicate = lambda s: s[field].lower() == value
+        else:
+            predicate = lambda s: s[field] == value
+        return self._memo(name, "linear_search", (field, value, ignore_case),
+                          lambda arr: linear_search(arr, predicate))
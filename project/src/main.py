@@ -1,13 +1,15 @@
 # src/main.py
 import csv
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from src.data_structs import Team, Match
-from src.bst import build_bst_by_name, build_bst_by_goals, top_k_by_inorder_goals
-from src.sorting import accumulate_points, top_k_by_points, bottom_k_by_points, merge_sort, insertion_sort
+from src.bst import build_bst_by_name, build_bst_by_goals
+from src.sorting import accumulate_points, merge_sort, insertion_sort
 from src.avl_points import build_avl_from_stats
-from src.search import linear_search, binary_search
+from src.cache import QueryCache
+from src.rating import EloConfig, run_elo, rating_stats
+from src.partials import PartialStore
 
 # caminhos possíveis para facilitar execução em diferentes ambientes
 DATA_PATHS = [
@@ -85,10 +87,26 @@ def write_summary(matches, out_path):
         for m in matches:
             writer.writerow(m.to_list())
 
-def demonstrate_searches(stats_list, sorted_by_name):
+def ingest_matches(matches, new_matches, cache: QueryCache):
+    """
+    Acrescenta novas partidas (in-place) e recalcula os datasets do cache derivados delas:
+    'stats', 'stats_by_name' e 'bst_goals'. set_dataset compara a impressão digital de cada um
+    e invalida só os que de fato mudaram; os demais (ex.: 'wc_stats', vindo dos parciais em
+    disco, atualizado por PartialStore.sync na próxima execução) continuam em cache.
+    Retorna (stats recalculados, número de entradas invalidadas).
+    """
+    matches.extend(new_matches)
+    stats = accumulate_points(matches)
+    invalidated = cache.set_dataset("stats", stats)
+    invalidated += cache.set_dataset("stats_by_name", merge_sort(stats, key=lambda s: s["name"]))
+    invalidated += cache.set_dataset("bst_goals", build_bst_by_goals(matches))
+    return stats, invalidated
+
+def demonstrate_searches(stats_list, sorted_by_name, cache: QueryCache):
     print("\n--- Exemplos de buscas ---")
     # busca linear: encontrar seleção que comece com 'Brazil' (exemplo)
-    idx = linear_search(stats_list, lambda s: s["name"].lower() == "brazil")
+    cache.set_dataset("stats", stats_list)
+    idx = cache.linear_search("stats", "name", "brazil", ignore_case=True)
     if idx is not None:
         print("Linear search: encontrado Brazil nos stats (índice):", idx, stats_list[idx])
     else:
@@ -97,7 +115,8 @@ def demonstrate_searches(stats_list, sorted_by_name):
     # busca binária: precisa de lista ordenada por name asc
     # preparar lista ordenada por name (tupla key)
     names_sorted = merge_sort(sorted_by_name, key=lambda s: s["name"], reverse=False)
-    bidx = binary_search(names_sorted, key_fn=lambda s: s["name"], target="Brazil")
+    cache.set_dataset("stats_by_name", names_sorted)
+    bidx = cache.binary_search("stats_by_name", "name", "Brazil")
     if bidx is not None:
         print("Binary search: encontrado Brazil em lista ordenada por nome (índice):", bidx, names_sorted[bidx])
     else:
@@ -119,6 +138,8 @@ def main():
     write_summary(matches, out_file)
     print(f"Arquivo gerado: {out_file} (total {len(matches)} linhas)")
 
+    cache = QueryCache(max_entries=256)
+
     # ---------- BSTs (Etapa 3) ----------
     bst_name = build_bst_by_name(matches)
     bst_goals = build_bst_by_goals(matches)
@@ -126,22 +147,24 @@ def main():
     print("Total seleções na BST (nome):", bst_name.size)
     print("Total seleções na BST (gols):", bst_goals.size)
 
-    top10_goals = top_k_by_inorder_goals(bst_goals, 10)
+    cache.set_dataset("bst_goals", bst_goals)
+    top10_goals = cache.top_k_by_inorder_goals("bst_goals", 10)
     print("\nTop 10 por gols (maiores):")
     for i, p in enumerate(top10_goals, 1):
         print(f"{i}. {p['name']} — {p['goals']} gols")
 
     # ---------- Pontos e Ordenação (Etapa 4) ----------
     stats = accumulate_points(matches)
+    cache.set_dataset("stats", stats)
     print(f"\nTotal seleções com estatísticas: {len(stats)}")
 
     print("\nTop 10 - por pontos (merge sort):")
-    for i, s in enumerate(top_k_by_points(stats, 10, use_merge=True), 1):
+    for i, s in enumerate(cache.top_k_by_points("stats", 10, use_merge=True), 1):
         gd = s["goals_for"] - s["goals_against"]
         print(f"{i}. {s['name']} — {s['points']} pts (W{s['wins']} D{s['draws']} L{s['losses']}), GD={gd}")
 
     print("\nBottom 10 - por pontos (insertion sort):")
-    for i, s in enumerate(bottom_k_by_points(stats, 10, use_merge=False), 1):
+    for i, s in enumerate(cache.bottom_k_by_points("stats", 10, use_merge=False), 1):
         gd = s["goals_for"] - s["goals_against"]
         print(f"{i}. {s['name']} — {s['points']} pts (W{s['wins']} D{s['draws']} L{s['losses']}), GD={gd}")
 
@@ -158,9 +181,53 @@ def main():
     for i, s in enumerate(vals_desc[:10], 1):
         print(f"{i}. {s['name']} — {s['points']} pts")
 
+    # ---------- Rating Elo (Extra) ----------
+    configs = [EloConfig(k=k, home_advantage=h) for k in (20, 40) for h in (0, 100)]
+    elo = run_elo(matches, configs)
+    print(f"\nRating Elo: {len(configs)} configurações em uma passada ({elo.batches} lotes)")
+    for ci, cfg in enumerate(configs):
+        leader = max(elo.final(ci).items(), key=lambda kv: kv[1])
+        print(f"  {cfg}: líder {leader[0]} ({leader[1]:.0f})")
+
+    elo_stats = rating_stats(stats, elo, config_index=0)
+    print(f"\nTop 10 por rating Elo ({configs[0]}):")
+    cache.set_dataset("elo_stats", elo_stats)
+    for i, s in enumerate(cache.top_k_by_points("elo_stats", 10, use_merge=True), 1):
+        print(f"{i}. {s['name']} — {s['rating']:.0f} (pontos tabela: {s['table_points']})")
+    elo_avl = build_avl_from_stats(elo_stats)
+    best = elo_avl.inorder()[-1]
+    print(f"AVL por rating — altura: {elo_avl.height()} | maior: {best['name']} ({best['rating']:.0f})")
+
+    # ---------- Parciais por temporada/torneio (Extra) ----------
+    store = PartialStore(os.path.join("output", "partials"))
+    changed_years = store.sync(matches)  # só os anos cujas partidas mudaram são recalculados
+    print(f"\nParciais recalculados: {len(changed_years)} ano(s)")
+    wc_stats = store.standings(years=range(2010, 2023), tournaments=["FIFA World Cup"])
+    print(f"Top 5 por pontos — Copas do Mundo 2010–2022 (parciais mesclados, {len(store.years())} anos em disco):")
+    cache.set_dataset("wc_stats", wc_stats)
+    for i, s in enumerate(cache.top_k_by_points("wc_stats", 5, use_merge=True), 1):
+        print(f"{i}. {s['name']} — {s['points']} pts (W{s['wins']} D{s['draws']} L{s['losses']})")
+
     # ---------- Buscas (Etapa 5/Extra) ----------
     # Para busca binária por nome precisamos de lista ordenada por name asc
-    demonstrate_searches(stats, stats)
+    demonstrate_searches(stats, stats, cache)
+
+    # ---------- Ingestão incremental (Extra) ----------
+    # demonstração em memória (nada é gravado): uma partida nova invalida apenas
+    # os datasets derivados das partidas; 'wc_stats' e 'elo_stats' continuam em cache
+    demo_match = Match(max(m.date for m in matches) + timedelta(days=1), Team("Brazil"), Team("Argentina"),
+                       "Friendly", "Rio de Janeiro", "Brazil", False, 1, 0)
+    leader = cache.top_k_by_points("stats", 10, use_merge=True)[0]  # mesma consulta do Top 10: hit
+    _, invalidated = ingest_matches(list(matches), [demo_match], cache)
+    preserved = cache.stats()["entries"]
+    new_leader = cache.top_k_by_points("stats", 10, use_merge=True)[0]  # recalculada (miss)
+    cache.top_k_by_points("wc_stats", 5, use_merge=True)  # dataset não afetado: hit
+    print(f"\nIngestão de 1 partida ({demo_match}): {invalidated} entradas invalidadas, {preserved} preservadas")
+    print(f"Líder por pontos: {leader['name']} {leader['points']} pts -> {new_leader['name']} {new_leader['points']} pts")
+
+    c = cache.stats()
+    print(f"\nCache de consultas: hits={c['hits']} misses={c['misses']} "
+          f"entradas={c['entries']} datasets={c['datasets']}")
 
     print("\nFinalizado. Verifique output/matches_summary.csv e os prints acima para incluir no relatório.")
 
@@ -0,0 +1,313 @@
+# src/partials.py
+"""
+Agregados parciais mescláveis (monoide) por temporada e torneio.
+
+TeamStats guarda, por seleção, [points, wins, draws, losses, goals_for, goals_against].
+A operação merge é associativa e TeamStats.empty() é o elemento neutro, então
+estatísticas de vários anos/torneios são obtidas somando parciais pré-calculados
+em vez de reprocessar todas as partidas.
+
+Fornece:
+- TeamStats: from_matches, merge (O(T)), to_stats_list (formato de accumulate_points),
+             goals_totals (formato de _accumulate_goals)
+- season_fingerprint(matches): impressão digital (hash) das partidas de uma temporada
+- PartialStore: parciais por (ano, torneio) gravados em disco (um JSON por ano, mais um
+                manifest.json com a impressão digital de cada ano); sync recalcula apenas
+                os anos cujas partidas mudaram e query/standings mesclam só os parciais pedidos.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+FIELDS = ("points", "wins", "draws", "losses", "goals_for", "goals_against")
+_P, _W, _D, _L, _GF, _GA = range(len(FIELDS))
+
+class TeamStats:
+    def __init__(self, table: Optional[Dict[str, List[int]]] = None):
+        # {team: [points, wins, draws, losses, goals_for, goals_against]}
+        self.table: Dict[str, List[int]] = table if table is not None else {}
+
+    @classmethod
+    def empty(cls) -> 'TeamStats':
+        return cls()
+
+    @classmethod
+    def from_matches(cls, matches) -> 'TeamStats':
+        """Mesmas regras de accumulate_points (3/1/0). Complexidade: O(N)."""
+        ts = cls()
+        for m in matches:
+            ts.add_match(m.home_team.name, m.away_team.name, m.home_score, m.away_score)
+        return ts
+
+    def add_match(self, home: str, away: str, hs: int, as_: int):
+        table = self.table
+        h = table.get(home)
+        if h is None:
+            h = table[home] = [0] * len(FIELDS)
+        a = table.get(away)
+        if a is None:
+            a = table[away] = [0] * len(FIELDS)
+        h[_GF] += hs; h[_GA] += as_
+        a[_GF] += as_; a[_GA] += hs
+        if hs > as_:
+            h[_W] += 1; h[_P] += 3; a[_L] += 1
+        elif hs < as_:
+            a[_W] += 1; a[_P] += 3; h[_L] += 1
+        else:
+            h[_D] += 1; a[_D] += 1
+            h[_P] += 1; a[_P] += 1
+
+    def merge(self, other: 'TeamStats') -> 'TeamStats':
+        """Retorna novo TeamStats = self + other. Complexidade: O(T)."""
+        res = TeamStats({team: row[:] for team, row in self.table.items()})
+        res.merge_into(other)
+        return res
+
+    def merge_into(self, other: 'TeamStats') -> 'TeamStats':
+        """Soma other em self (in-place) e retorna self. Complexidade: O(T_other)."""
+        for team, row in other.table.items():
+            cur = self.table.get(team)
+            if cur is None:
+                self.table[team] = row[:]
+            else:
+                for i, v in enumerate(row):
+                    cur[i] += v
+        return self
+
+    def __add__(self, other: 'TeamStats') -> 'TeamStats':
+        return self.merge(other)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, TeamStats) and self.table == other.table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def to_stats_list(self) -> List[Dict]:
+        """Lista de dicts no mesmo formato de accumulate_points."""
+        out = []
+        for team, row in self.table.items():
+            d = {"name": team}
+            d.update(zip(FIELDS, row))
+            out.append(d)
+        return out
+
+    def goals_totals(self) -> Dict[str, int]:
+        """{team: total_gols} no mesmo formato de _accumulate_goals."""
+        return {team: row[_GF] for team, row in self.table.items()}
+
+    def __repr__(self):
+        return f"TeamStats(teams={len(self.table)})"
+
+def merge_all(partials: Iterable[TeamStats]) -> TeamStats:
+    """Mescla uma sequência de parciais (fold a partir do elemento neutro)."""
+    acc = TeamStats.empty()
+    for p in partials:
+        acc.merge_into(p)
+    return acc
+
+def season_fingerprint(matches) -> str:
+    """
+    Hash (sha1) dos campos que entram nos agregados, na ordem das partidas.
+    Qualquer linha corrigida, incluída ou removida na temporada muda o resultado.
+    """
+    h = hashlib.sha1()
+    for m in matches:
+        row = f"{m.date:%Y-%m-%d}|{m.tournament}|{m.home_team.name}|{m.away_team.name}|{m.home_score}|{m.away_score}\n"
+        h.update(row.encode("utf-8"))
+    return h.hexdigest()
+
+class PartialStore:
+    MANIFEST = "manifest.json"
+
+    def __init__(self, directory: str):
+        """directory: pasta com <ano>.json = {torneio: {team: [..]}} e manifest.json."""
+        self.directory = directory
+        self._loaded: Dict[int, Dict[str, TeamStats]] = {}
+        self._manifest: Optional[Dict[str, Dict]] = None
+
+    # ---------- disco ----------
+    def _path(self, year: int) -> str:
+        return os.path.join(self.directory, f"{year}.json")
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.directory, self.MANIFEST)
+
+    def manifest(self) -> Dict[str, Dict]:
+        """{ano (str): {'fingerprint': sha1, 'matches': n}} dos parciais gravados."""
+        if self._manifest is None:
+            path = self._manifest_path()
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    self._manifest = json.load(f)
+            else:
+                self._manifest = {}
+        return self._manifest
+
+    def _save_manifest(self):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._manifest_path(), "w", encoding="utf-8") as f:
+            json.dump(self.manifest(), f, indent=0, sort_keys=True)
+
+    def _write_year(self, year: int, season, fingerprint: str):
+        partials = self._group(season).get(year, {})
+        os.makedirs(self.directory, exist_ok=True)
+        data = {t: ts.table for t, ts in partials.items()}
+        with open(self._path(year), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        self._loaded[year] = partials
+        self.manifest()[str(year)] = {"fingerprint": fingerprint, "matches": len(season)}
+
+    def _remove_year(self, year: int):
+        if os.path.exists(self._path(year)):
+            os.remove(self._path(year))
+        self._loaded.pop(year, None)
+        self.manifest().pop(str(year), None)
+
+    def _load_year(self, year: int) -> Dict[str, TeamStats]:
+        if year not in self._loaded:
+            path = self._path(year)
+            if not os.path.exists(path):
+                self._loaded[year] = {}
+            else:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                self._loaded[year] = {t: TeamStats(table) for t, table in data.items()}
+        return self._loaded[year]
+
+    def years(self) -> List[int]:
+        """Anos com parcial registrado no manifest."""
+        return sorted(int(y) for y in self.manifest())
+
+    # ---------- construção / atualização ----------
+    @staticmethod
+    def _by_year(matches) -> Dict[int, List]:
+        seasons: Dict[int, List] = {}
+        for m in matches:
+            seasons.setdefault(m.date.year, []).append(m)
+        return seasons
+
+    @staticmethod
+    def _group(matches) -> Dict[int, Dict[str, TeamStats]]:
+        grouped: Dict[int, Dict[str, TeamStats]] = {}
+        for m in matches:
+            by_t = grouped.setdefault(m.date.year, {})
+            ts = by_t.get(m.tournament)
+            if ts is None:
+                ts = by_t[m.tournament] = TeamStats()
+            ts.add_match(m.home_team.name, m.away_team.name, m.home_score, m.away_score)
+        return grouped
+
+    def build(self, matches):
+        """Recalcula e grava todos os parciais (ano, torneio). Complexidade: O(N)."""
+        seasons = self._by_year(matches)
+        for year in self.years():
+            if year not in seasons:
+                self._remove_year(year)
+        for year, season in seasons.items():
+            self._write_year(year, season, season_fingerprint(season))
+        self._save_manifest()
+
+    def sync(self, matches) -> List[int]:
+        """
+        Compara a impressão digital de cada temporada com o manifest e recalcula apenas
+        os anos alterados (ou novos); anos que sumiram das partidas são removidos.
+        Retorna a lista ordenada de anos recalculados/removidos (vazia = nada mudou).
+        Complexidade: O(N) para o hash + O(N_alterados) para recalcular.
+        """
+        seasons = self._by_year(matches)
+        manifest = self.manifest()
+        changed = []
+        for year in self.years():
+            if year not in seasons:
+                self._remove_year(year)
+                changed.append(year)
+        for year, season in seasons.items():
+            fp = season_fingerprint(season)
+            entry = manifest.get(str(year))
+            if entry is None or entry.get("fingerprint") != fp or not os.path.exists(self._path(year)):
+                self._write_year(year, season, fp)
+                changed.append(year)
+        if changed:
+            self._save_manifest()
+        return sorted(changed)
+
+    def refresh_year(self, matches, year: Optional[int] = None):
+        """
+        Recalcula somente o parcial de uma temporada (padrão: o ano mais recente das partidas).
+        matches pode ser a lista completa ou apenas as partidas da temporada.
+        Sem partidas (e sem year), não há o que recalcular.
+        """
+        if year is None:
+            if not matches:
+                return
+            year = max(m.date.year for m in matches)
+        season = [m for m in matches if m.date.year == year]
+        if season:
+            self._write_year(year, season, season_fingerprint(season))
+        else:
+            self._remove_year(year)
+        self._save_manifest()
+
+    # ---------- consultas ----------
+    def query(self, years: Optional[Iterable[int]] = None,
+              tournaments: Optional[Iterable[str]] = None) -> TeamStats:
+        """
+        Mescla os parciais dos anos/torneios pedidos (None = todos).
+        Complexidade: O(P * T) onde P = parciais mesclados, sem reprocessar partidas.
+        """
+        years = self.years() if years is None else years
+        wanted = set(tournaments) if tournaments is not None else None
+        acc = TeamStats.empty()
+        for y in years:
+            for t, ts in self._load_year(y).items():
+                if wanted is None or t in wanted:
+                    acc.merge_into(ts)
+        return acc
+
+    def standings(self, years: Optional[Iterable[int]] = None,
+                  tournaments: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Stats no formato de accumulate_points, prontos para top_k_by_points/AVL."""
+        return self.query(years, tournaments).to_stats_list()
+
+# ---------- auto-verificação ----------
+if __name__ == "__main__":
+    import copy
+    import tempfile
+
+    from src.bst import _accumulate_goals
+    from src.main import find_csv, read_matches
+    from src.sorting import accumulate_points
+
+    def by_name(stats_list):
+        return sorted(stats_list, key=lambda s: s["name"])
+
+    matches, _, _ = read_matches(find_csv())
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PartialStore(tmp)
+        print("anos recalculados (1ª sync):", len(store.sync(matches)))
+
+        # 1) parciais mesclados == agregados calculados do zero (dataset completo)
+        assert by_name(store.standings()) == by_name(accumulate_points(matches))
+        assert store.query().goals_totals() == _accumulate_goals(matches)
+
+        # 2) recorte por anos/torneios
+        years, tournaments = range(2010, 2021), ["FIFA World Cup", "Copa América"]
+        subset = [m for m in matches if m.date.year in years and m.tournament in tournaments]
+        assert by_name(store.standings(years, tournaments)) == by_name(accumulate_points(subset))
+
+        # 3) nova instância sobre o disco, sem mudanças: nada é recalculado
+        assert PartialStore(tmp).sync(matches) == []
+
+        # 4) corrigir uma linha antiga recalcula só aquele ano
+        edited = list(matches)
+        i = next(i for i, m in enumerate(edited) if m.date.year == 1950)
+        fixed = copy.copy(edited[i])
+        fixed.home_score += 1
+        edited[i] = fixed
+        assert PartialStore(tmp).sync(edited) == [1950]
+        assert by_name(PartialStore(tmp).standings()) == by_name(accumulate_points(edited))
+
+    print("auto-verificação: parciais == accumulate_points/_accumulate_goals; sync recalcula só o ano alterado")
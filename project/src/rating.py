@@ -0,0 +1,197 @@
+# src/rating.py
+"""
+Rating cronológico (estilo Elo) das seleções.
+
+Diferente de accumulate_points, o rating considera o adversário e a ordem das partidas:
+    E_home = 1 / (1 + 10 ** ((R_away - R_home - H) / 400))   (H = vantagem de mando; 0 se neutral)
+    R_home += K * (S_home - E_home)    R_away -= K * (S_home - E_home)
+com S_home = 1 (vitória), 0.5 (empate), 0 (derrota).
+
+As partidas são processadas por data e agrupadas em lotes: partidas do mesmo dia sem seleção
+em comum formam um lote, cujas atualizações são independentes entre si.
+Observação: sem numpy (o projeto usa apenas a biblioteca padrão) o lote não vetoriza nada —
+o custo por partida é o mesmo de um laço simples. O agrupamento só deixa pronta a estrutura
+para um futuro backend com arrays. O ganho real vem de avaliar várias configurações (K, H)
+na mesma passada: a leitura/ordenação das partidas é feita uma vez para todas.
+
+Fornece:
+- EloConfig: parâmetros (k, home_advantage, initial)
+- schedule_batches(matches): lotes de partidas independentes em ordem cronológica
+- run_elo(matches, configs): EloResult com ratings finais e série temporal por seleção
+- rating_stats(stats_list, result, config_index): stats com 'points' = rating (float exato),
+  prontos para build_avl_from_stats e top_k_by_points
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+@dataclass(frozen=True)
+class EloConfig:
+    k: float = 20.0
+    home_advantage: float = 100.0
+    initial: float = 1500.0
+
+class EloResult:
+    def __init__(self, configs: List[EloConfig], ratings: Dict[str, List[float]],
+                 history: Dict[str, List[Tuple[datetime, Tuple[float, ...]]]], batches: int):
+        self.configs = configs
+        self.ratings = ratings    # {team: [rating por configuração]}
+        self.history = history    # {team: [(data, (rating por configuração)), ...]} após cada partida
+        self.batches = batches
+
+    def final(self, config_index: int = 0) -> Dict[str, float]:
+        """Ratings finais {team: rating} para uma configuração."""
+        return {team: r[config_index] for team, r in self.ratings.items()}
+
+    def series(self, team: str, config_index: int = 0) -> List[Tuple[datetime, float]]:
+        """Série temporal [(data, rating)] de uma seleção para uma configuração."""
+        return [(d, r[config_index]) for d, r in self.history.get(team, [])]
+
+    def __repr__(self):
+        return f"EloResult(teams={len(self.ratings)}, configs={len(self.configs)}, batches={self.batches})"
+
+def schedule_batches(matches) -> List[List]:
+    """
+    Ordena as partidas por data (estável: mantém a ordem do CSV no mesmo dia) e divide cada dia
+    em lotes sem seleção repetida (atribuição gulosa ao primeiro lote livre).
+    A ordem relativa das partidas de uma mesma seleção é preservada.
+    Complexidade: O(N log N) pela ordenação + O(N * B) onde B = lotes por dia (pequeno).
+    """
+    ordered = sorted(matches, key=lambda m: m.date)
+    batches: List[List] = []
+    i = 0
+    n = len(ordered)
+    while i < n:
+        day = ordered[i].date
+        day_batches: List[List] = []
+        day_teams: List[set] = []
+        last_batch: Dict[str, int] = {}
+        while i < n and ordered[i].date == day:
+            m = ordered[i]
+            h, a = m.home_team.name, m.away_team.name
+            # o lote precisa vir depois do último lote de cada seleção (preserva a ordem)
+            b = max(last_batch.get(h, -1), last_batch.get(a, -1)) + 1
+            while b < len(day_batches) and (h in day_teams[b] or a in day_teams[b]):
+                b += 1
+            if b == len(day_batches):
+                day_batches.append([])
+                day_teams.append(set())
+            day_batches[b].append(m)
+            day_teams[b].update((h, a))
+            last_batch[h] = last_batch[a] = b
+            i += 1
+        batches.extend(day_batches)
+    return batches
+
+def run_elo(matches, configs: Optional[Sequence[EloConfig]] = None,
+            record_history: bool = True) -> EloResult:
+    """
+    Calcula os ratings para todas as configurações em uma única passada cronológica.
+    Complexidade: O(N log N + N * C) onde C = número de configurações.
+    """
+    configs = list(configs) if configs else [EloConfig()]
+    ks = [c.k for c in configs]
+    hadv = [c.home_advantage for c in configs]
+    cidx = range(len(configs))
+    initial = [c.initial for c in configs]
+
+    ratings: Dict[str, List[float]] = {}
+    history: Dict[str, List[Tuple[datetime, Tuple[float, ...]]]] = {}
+    batches = schedule_batches(matches)
+
+    for batch in batches:
+        # 1) leitura dos ratings anteriores ao lote
+        homes = []
+        aways = []
+        for m in batch:
+            h, a = m.home_team.name, m.away_team.name
+            if h not in ratings:
+                ratings[h] = initial[:]
+            if a not in ratings:
+                ratings[a] = initial[:]
+            homes.append(ratings[h])
+            aways.append(ratings[a])
+        scores = [1.0 if m.home_score > m.away_score else 0.5 if m.home_score == m.away_score else 0.0
+                  for m in batch]
+        neutral = [m.neutral for m in batch]
+
+        # 2) deltas de todo o lote (partidas x configurações) a partir dos ratings anteriores
+        deltas = [
+            [ks[c] * (s - 1.0 / (1.0 + 10.0 ** ((ra[c] - rh[c] - (0.0 if nt else hadv[c])) / 400.0)))
+             for c in cidx]
+            for rh, ra, s, nt in zip(homes, aways, scores, neutral)
+        ]
+
+        # 3) aplicação: nenhuma seleção se repete no lote, então a ordem não importa
+        for m, rh, ra, d in zip(batch, homes, aways, deltas):
+            for c in cidx:
+                rh[c] += d[c]
+                ra[c] -= d[c]
+            if record_history:
+                history.setdefault(m.home_team.name, []).append((m.date, tuple(rh)))
+                history.setdefault(m.away_team.name, []).append((m.date, tuple(ra)))
+
+    return EloResult(configs, ratings, history, len(batches))
+
+def rating_stats(stats_list: List[Dict], result: EloResult, config_index: int = 0) -> List[Dict]:
+    """
+    Retorna cópias dos stats (de accumulate_points) com 'points' = 'rating' = valor exato (float)
+    e 'table_points' = pontos originais (3/1/0).
+    Assim o ranking por rating reutiliza build_avl_from_stats e top_k_by_points; o valor não é
+    arredondado para que empates no inteiro não sejam desfeitos por saldo de gols ou nome.
+    """
+    final = result.final(config_index)
+    out = []
+    for s in stats_list:
+        r = final.get(s["name"], result.configs[config_index].initial)
+        d = dict(s)
+        d["table_points"] = s["points"]
+        d["rating"] = r
+        d["points"] = r
+        out.append(d)
+    return out
+
+def _sequential_elo(matches, config: EloConfig) -> Dict[str, float]:
+    """Referência: Elo partida a partida, sem lotes, para uma configuração (usado na auto-verificação)."""
+    ratings: Dict[str, float] = {}
+    for m in sorted(matches, key=lambda m: m.date):
+        h, a = m.home_team.name, m.away_team.name
+        rh = ratings.get(h, config.initial)
+        ra = ratings.get(a, config.initial)
+        s = 1.0 if m.home_score > m.away_score else 0.5 if m.home_score == m.away_score else 0.0
+        hadv = 0.0 if m.neutral else config.home_advantage
+        d = config.k * (s - 1.0 / (1.0 + 10.0 ** ((ra - rh - hadv) / 400.0)))
+        ratings[h] = rh + d
+        ratings[a] = ra - d
+    return ratings
+
+# ---------- exemplo rápido + auto-verificação ----------
+if __name__ == "__main__":
+    from types import SimpleNamespace
+
+    def M(day, h, a, hs, as_, neutral=False):
+        return SimpleNamespace(date=datetime(2020, 1, day), home_team=SimpleNamespace(name=h),
+                               away_team=SimpleNamespace(name=a), home_score=hs, away_score=as_,
+                               neutral=neutral)
+
+    sample = [M(1, "A", "B", 2, 0), M(1, "C", "D", 1, 1), M(2, "A", "C", 0, 1), M(2, "B", "D", 3, 1)]
+    res = run_elo(sample, [EloConfig(k=20, home_advantage=100), EloConfig(k=40, home_advantage=0)])
+    print(res)
+    for c in range(len(res.configs)):
+        print(res.configs[c], {t: round(r, 1) for t, r in res.final(c).items()})
+    print("série A:", res.series("A"))
+
+    # auto-verificação no dataset real: lotes + várias configurações == Elo sequencial
+    from src.main import find_csv, read_matches
+    matches, _, _ = read_matches(find_csv())
+    configs = [EloConfig(k=k, home_advantage=h) for k in (10, 20, 40) for h in (0, 50, 100)]
+    res = run_elo(matches, configs, record_history=False)
+    worst = 0.0
+    for ci, cfg in enumerate(configs):
+        ref = _sequential_elo(matches, cfg)
+        got = res.final(ci)
+        assert ref.keys() == got.keys()
+        worst = max(worst, max(abs(ref[t] - got[t]) for t in ref))
+    assert worst < 1e-6, worst
+    print(f"auto-verificação: {len(configs)} configurações, diferença máxima para o Elo sequencial = {worst:.2e}")